@@ -16,16 +16,15 @@ def cosine_similarity(X: Matrix, Y: Matrix) -> np.ndarray:
     if len(X) == 0 or len(Y) == 0:
         return np.array([])
 
-    X = np.array(X)
-    Y = np.array(Y)
+    # no copy is made if the inputs are already float32 arrays
+    X = np.asarray(X, dtype=np.float32)
+    Y = np.asarray(Y, dtype=np.float32)
     if X.shape[1] != Y.shape[1]:
         raise ValueError(
             f"Number of columns in X and Y must be the same. X has shape {X.shape} "
             f"and Y has shape {Y.shape}."
         )
 
-    X = np.array(X, dtype=np.float32)
-    Y = np.array(Y, dtype=np.float32)
     Z = 1 - np.array(simsimd.cdist(X, Y, metric="cosine"))
     if isinstance(Z, float):
         return np.array([Z])
@@ -1,7 +1,7 @@
 """Utility functions for working with vectors and vectorstores."""
 
 from enum import Enum
-from typing import List
+from typing import List, Union
 
 import numpy as np
 
@@ -21,33 +21,34 @@ class DistanceStrategy(str, Enum):
 
 def maximal_marginal_relevance(
     query_embedding: np.ndarray,
-    embedding_list: list,
+    embedding_list: Union[list, np.ndarray],
     lambda_mult: float = 0.5,
     k: int = 4,
 ) -> List[int]:
     """Calculate maximal marginal relevance."""
     if min(k, len(embedding_list)) <= 0:
         return []
+    embeddings = np.asarray(embedding_list)
     if query_embedding.ndim == 1:
         query_embedding = np.expand_dims(query_embedding, axis=0)
-    similarity_to_query = cosine_similarity(query_embedding, embedding_list)[0]
+    similarity_to_query = cosine_similarity(query_embedding, embeddings)[0]
     most_similar = int(np.argmax(similarity_to_query))
     idxs = [most_similar]
-    selected = np.array([embedding_list[most_similar]])
-    while len(idxs) < min(k, len(embedding_list)):
-        best_score = -np.inf
-        idx_to_add = -1
-        similarity_to_selected = cosine_similarity(embedding_list, selected)
-        for i, query_score in enumerate(similarity_to_query):
-            if i in idxs:
-                continue
-            redundant_score = max(similarity_to_selected[i])
-            equation_score = (
-                lambda_mult * query_score - (1 - lambda_mult) * redundant_score
-            )
-            if equation_score > best_score:
-                best_score = equation_score
-                idx_to_add = i
+    # the highest similarity of each candidate to any selected embedding, updated
+    # incrementally instead of recomputing it against all selected embeddings
+    max_similarity_to_selected = cosine_similarity(
+        embeddings, embeddings[[most_similar]]
+    )[:, 0]
+    while len(idxs) < min(k, len(embeddings)):
+        equation_scores = (
+            lambda_mult * similarity_to_query
+            - (1 - lambda_mult) * max_similarity_to_selected
+        )
+        equation_scores[idxs] = -np.inf
+        idx_to_add = int(np.argmax(equation_scores))
         idxs.append(idx_to_add)
-        selected = np.append(selected, [embedding_list[idx_to_add]], axis=0)
+        similarity_to_added = cosine_similarity(embeddings, embeddings[[idx_to_add]])
+        max_similarity_to_selected = np.maximum(
+            max_similarity_to_selected, similarity_to_added[:, 0]
+        )
     return idxs
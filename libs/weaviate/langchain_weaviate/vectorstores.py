@@ -1,18 +1,25 @@
 from __future__ import annotations
 
+import asyncio
 import datetime
+import functools
 import logging
 from collections.abc import Generator
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
+from itertools import chain, islice
 from typing import (
     TYPE_CHECKING,
+    AbstractSet,
     Any,
     Callable,
     Dict,
     Iterable,
+    Iterator,
     List,
     Literal,
     Optional,
+    Set,
     Tuple,
     Union,
     overload,
@@ -23,12 +30,14 @@ import numpy as np
 import weaviate  # type: ignore
 from langchain_core.documents import Document
 from langchain_core.embeddings import Embeddings
+from langchain_core.runnables.config import run_in_executor
 from langchain_core.vectorstores import VectorStore
 
 from langchain_weaviate.utils import maximal_marginal_relevance
 
 if TYPE_CHECKING:
     import weaviate
+    from weaviate.collections.batch.client import ClientBatchingContextManager
 
 
 logger = logging.getLogger(__name__)
@@ -56,11 +65,16 @@ def _default_schema(index_name: str) -> Dict:
 
 
 def _default_score_normalizer(val: float) -> float:
+    return float(_normalize_scores(np.asarray(val)))
+
+
+def _normalize_scores(scores: np.ndarray) -> np.ndarray:
+    """Vectorized version of ``_default_score_normalizer``."""
     # prevent overflow
     # use 709 because that's the largest exponent that doesn't overflow
     # use -709 because that's the smallest exponent that doesn't underflow
-    val = np.clip(val, -709, 709)
-    return 1 - 1 / (1 + np.exp(val))
+    scores = np.clip(scores, -709, 709)
+    return 1 - 1 / (1 + np.exp(scores))
 
 
 def _json_serializable(value: Any) -> Any:
@@ -69,6 +83,44 @@ def _json_serializable(value: Any) -> Any:
     return value
 
 
+def _datetime_keys(metadata: dict) -> Set[str]:
+    """Return the keys of ``metadata`` that may hold a datetime in a row with the
+    same keys: those that hold one, and those that are None."""
+    return {
+        key
+        for key, val in metadata.items()
+        if val is None or isinstance(val, datetime.datetime)
+    }
+
+
+def _check_embed_batch_size(embed_batch_size: int) -> None:
+    if embed_batch_size < 1:
+        raise ValueError(
+            f"embed_batch_size must be at least 1, got {embed_batch_size}."
+        )
+
+
+def _embed_documents(embedding: Embeddings, texts: List[str]) -> List[List[float]]:
+    """Embed texts, computing the embedding of each distinct text only once.
+
+    The distinct texts are embedded in order of length, so that the batches the
+    embedding provider processes hold texts of similar length and need less
+    padding.
+    """
+    unique_texts = sorted(dict.fromkeys(texts), key=len)
+    vectors = dict(zip(unique_texts, embedding.embed_documents(unique_texts)))
+    return [vectors[text] for text in texts]
+
+
+async def _aembed_documents(
+    embedding: Embeddings, texts: List[str]
+) -> List[List[float]]:
+    """Async version of ``_embed_documents``."""
+    unique_texts = sorted(dict.fromkeys(texts), key=len)
+    vectors = dict(zip(unique_texts, await embedding.aembed_documents(unique_texts)))
+    return [vectors[text] for text in texts]
+
+
 class WeaviateVectorStore(VectorStore):
     """`Weaviate` vector store.
 
@@ -97,8 +149,14 @@ class WeaviateVectorStore(VectorStore):
             Callable[[float], float]
         ] = _default_score_normalizer,
         use_multi_tenancy: bool = False,
+        vector_index_config: Optional[Dict] = None,
     ):
-        """Initialize with Weaviate client."""
+        """Initialize with Weaviate client.
+
+        ``vector_index_config`` is used as the ``vectorIndexConfig`` of the
+        collection when it is created, e.g. ``{"bq": {"enabled": True}}`` to
+        store compressed vectors with binary quantization.
+        """
 
         if not isinstance(client, weaviate.WeaviateClient):
             raise ValueError(
@@ -118,6 +176,8 @@ class WeaviateVectorStore(VectorStore):
         schema["MultiTenancyConfig"] = {"enabled": use_multi_tenancy}
         if vectorizer:
             schema["vectorizer"] = vectorizer
+        if vector_index_config:
+            schema["vectorIndexConfig"] = vector_index_config
         # check whether the index already exists
         if not client.collections.exists(self._index_name):
             client.collections.create_from_dict(schema)
@@ -125,6 +185,11 @@ class WeaviateVectorStore(VectorStore):
         # store collection for convenience
         # this does not actually send a request to weaviate
         self._collection = client.collections.get(self._index_name)
+        # with_tenant builds a new collection object on every call, so keep the
+        # ones for recently used tenants around
+        self._with_tenant = functools.lru_cache(maxsize=128)(
+            self._collection.with_tenant
+        )
 
         # store this setting so we don't have to send a request to weaviate
         # every time we want to do a CRUD operation
@@ -143,16 +208,334 @@ class WeaviateVectorStore(VectorStore):
             else _default_score_normalizer
         )
 
+    def _similarity_search_with_relevance_scores(
+        self,
+        query: str,
+        k: int = 4,
+        **kwargs: Any,
+    ) -> List[Tuple[Document, float]]:
+        docs_and_scores = self.similarity_search_with_score(query, k, **kwargs)
+        return self._to_relevance_scores(docs_and_scores)
+
+    async def _asimilarity_search_with_relevance_scores(
+        self,
+        query: str,
+        k: int = 4,
+        **kwargs: Any,
+    ) -> List[Tuple[Document, float]]:
+        docs_and_scores = await self.asimilarity_search_with_score(query, k, **kwargs)
+        return self._to_relevance_scores(docs_and_scores)
+
+    def _to_relevance_scores(
+        self, docs_and_scores: List[Tuple[Document, float]]
+    ) -> List[Tuple[Document, float]]:
+        """Convert the scores of a search into relevance scores."""
+        relevance_score_fn = self._select_relevance_score_fn()
+        if relevance_score_fn is not _default_score_normalizer:
+            return [(doc, relevance_score_fn(score)) for doc, score in docs_and_scores]
+
+        # normalize all the scores in a single call instead of one call per score
+        scores = _normalize_scores(
+            np.array([score for _, score in docs_and_scores], dtype=np.float64)
+        )
+        return [(doc, float(score)) for (doc, _), score in zip(docs_and_scores, scores)]
+
     def add_texts(
         self,
         texts: Iterable[str],
         metadatas: Optional[List[dict]] = None,
         tenant: Optional[str] = None,
+        embed_batch_size: int = 512,
+        **kwargs: Any,
+    ) -> List[str]:
+        """Upload texts with metadata (properties) to Weaviate.
+
+        The texts are consumed ``embed_batch_size`` at a time, so that an iterator
+        can be ingested without holding all of its texts and embeddings in memory.
+
+        Args:
+            texts: Texts to add to the vector store.
+            metadatas: Metadata associated with each text.
+            tenant: The tenant name. Defaults to None.
+            embed_batch_size: Number of texts to embed at a time. Defaults to 512.
+            **kwargs: ``ids`` or ``uuids`` to use for the objects. ``batch_size``
+                and ``concurrent_requests`` switch the upload from dynamic
+                batching to fixed-size batches of ``batch_size`` objects, with
+                ``concurrent_requests`` (default 2) requests in flight.
+        """
+        _check_embed_batch_size(embed_batch_size)
+        return self._add_embedded_chunks(
+            self._embed_chunks(texts, embed_batch_size), metadatas, tenant, **kwargs
+        )
+
+    def _embed_chunks(
+        self, texts: Iterable[str], embed_batch_size: int
+    ) -> Iterator[Tuple[List[str], Optional[List[List[float]]]]]:
+        """Lazily embed ``texts`` ``embed_batch_size`` at a time."""
+        texts_iter = iter(texts)
+        while chunk := list(islice(texts_iter, embed_batch_size)):
+            embeddings: Optional[List[List[float]]] = None
+            if self._embedding:
+                embeddings = _embed_documents(self._embedding, chunk)
+            yield chunk, embeddings
+
+    def _add_embedded_chunks(
+        self,
+        embedded_chunks: Iterable[Tuple[List[str], Optional[List[List[float]]]]],
+        metadatas: Optional[List[dict]] = None,
+        tenant: Optional[str] = None,
+        **kwargs: Any,
+    ) -> List[str]:
+        """Upload ``(texts, embeddings)`` chunks through a single batch."""
+        self._create_tenant_if_missing(tenant)
+
+        ids: List[str] = []
+        with self._batch_context(**kwargs) as batch:
+            for chunk, embeddings in embedded_chunks:
+                ids.extend(
+                    self._add_objects_to_batch(
+                        batch,
+                        chunk,
+                        embeddings,
+                        metadatas,
+                        tenant,
+                        offset=len(ids),
+                        **kwargs,
+                    )
+                )
+
+        self._log_failed_objects()
+        return ids
+
+    def add_embeddings(
+        self,
+        texts: Iterable[str],
+        embeddings: Union[List[List[float]], np.ndarray],
+        metadatas: Optional[List[dict]] = None,
+        tenant: Optional[str] = None,
+        **kwargs: Any,
+    ) -> List[str]:
+        """Upload texts with precomputed embeddings and metadata to Weaviate.
+
+        The embedding model of the vector store is not used, so this is the fast
+        path for vectors that were computed elsewhere.
+
+        Args:
+            texts: Texts to add to the vector store.
+            embeddings: Embedding of each text, as a list of vectors or a 2-D
+                array.
+            metadatas: Metadata associated with each text.
+            tenant: The tenant name. Defaults to None.
+            **kwargs: Same as for ``add_texts``.
+        """
+        texts = list(texts)
+        if len(texts) != len(embeddings):
+            raise ValueError(
+                f"Got {len(texts)} texts but {len(embeddings)} embeddings. "
+                "There must be exactly one embedding per text."
+            )
+        vectors: List[List[float]] = (
+            embeddings.tolist() if isinstance(embeddings, np.ndarray) else embeddings
+        )
+
+        return self._add_objects(texts, vectors, metadatas, tenant, **kwargs)
+
+    async def aadd_texts(
+        self,
+        texts: Iterable[str],
+        metadatas: Optional[List[dict]] = None,
+        tenant: Optional[str] = None,
+        embed_batch_size: int = 512,
+        max_concurrency: int = 8,
         **kwargs: Any,
     ) -> List[str]:
-        """Upload texts with metadata (properties) to Weaviate."""
-        from weaviate.util import get_valid_uuid  # type: ignore
+        """Upload texts with metadata (properties) to Weaviate.
+
+        Embedding and uploading run as a pipeline: the texts are embedded
+        concurrently in shards of ``embed_batch_size``, with at most
+        ``max_concurrency`` embedding requests in flight, and each shard is
+        added to the Weaviate batch as soon as its embeddings are available.
+
+        See ``add_texts`` for the supported ``kwargs``.
+        """
+        _check_embed_batch_size(embed_batch_size)
+        texts = list(texts)
+
+        if not self._embedding:
+            return await run_in_executor(
+                None, self._add_objects, texts, None, metadatas, tenant, **kwargs
+            )
+
+        embedding = self._embedding
+        loop = asyncio.get_running_loop()
+        # a slot is taken before a shard is embedded and only given back by the
+        # consumer once the shard is uploaded, so at most max_concurrency shards
+        # are being embedded or waiting to be uploaded at any time
+        semaphore = asyncio.Semaphore(max_concurrency)
+        queue: asyncio.Queue[Optional[Tuple[int, List[List[float]]]]] = asyncio.Queue()
+
+        async def _embed_shard(offset: int) -> None:
+            try:
+                vectors = await _aembed_documents(
+                    embedding, texts[offset : offset + embed_batch_size]
+                )
+            except BaseException:
+                semaphore.release()
+                raise
+            await queue.put((offset, vectors))
+
+        async def _produce() -> None:
+            tasks: List[asyncio.Task] = []
+            try:
+                for offset in range(0, len(texts), embed_batch_size):
+                    await semaphore.acquire()
+                    # stop dispatching shards as soon as one of them failed
+                    for task in tasks:
+                        if task.done():
+                            task.result()
+                    tasks = [task for task in tasks if not task.done()]
+                    tasks.append(asyncio.ensure_future(_embed_shard(offset)))
+                await asyncio.gather(*tasks)
+            finally:
+                for task in tasks:
+                    task.cancel()
+                # signal the consumer that there are no more shards
+                queue.put_nowait(None)
+
+        def _consume() -> List[str]:
+            # runs in a worker thread, since the batch blocks while sending
+            self._create_tenant_if_missing(tenant)
+
+            ids: List[str] = [""] * len(texts)
+            with self._batch_context(**kwargs) as batch:
+                while True:
+                    item = asyncio.run_coroutine_threadsafe(queue.get(), loop).result()
+                    if item is None:
+                        break
+                    offset, vectors = item
+                    ids[offset : offset + len(vectors)] = self._add_objects_to_batch(
+                        batch,
+                        texts[offset : offset + len(vectors)],
+                        vectors,
+                        metadatas,
+                        tenant,
+                        offset=offset,
+                        **kwargs,
+                    )
+                    loop.call_soon_threadsafe(semaphore.release)
+
+            self._log_failed_objects()
+            return ids
+
+        producer = asyncio.ensure_future(_produce())
+        try:
+            ids = await run_in_executor(None, _consume)
+        except BaseException:
+            # stop embedding once there is nothing left to upload the shards
+            producer.cancel()
+            await asyncio.gather(producer, return_exceptions=True)
+            raise
+
+        # raise any error from embedding the shards
+        await producer
+        return ids
 
+    def _add_objects(
+        self,
+        texts: List[str],
+        embeddings: Optional[List[List[float]]],
+        metadatas: Optional[List[dict]] = None,
+        tenant: Optional[str] = None,
+        **kwargs: Any,
+    ) -> List[str]:
+        """Upload texts and their (optional) vectors to Weaviate in a batch."""
+        self._create_tenant_if_missing(tenant)
+
+        with self._batch_context(**kwargs) as batch:
+            ids = self._add_objects_to_batch(
+                batch, texts, embeddings, metadatas, tenant, **kwargs
+            )
+
+        self._log_failed_objects()
+        return ids
+
+    def _add_objects_to_batch(
+        self,
+        batch: Any,
+        texts: List[str],
+        embeddings: Optional[List[List[float]]],
+        metadatas: Optional[List[dict]] = None,
+        tenant: Optional[str] = None,
+        offset: int = 0,
+        **kwargs: Any,
+    ) -> List[str]:
+        """Add texts to an open Weaviate batch.
+
+        ``offset`` is the position of ``texts[0]`` in the caller's input, and is
+        used to look up the matching metadata and ids.
+        """
+        # Allow for ids (consistent w/ other methods)
+        # # Or uuids (backwards compatible w/ existing arg)
+        # If the UUID of one of the objects already exists
+        # then the existing object will be replaced by the new object.
+        given_ids = None
+        if "uuids" in kwargs:
+            given_ids = kwargs["uuids"]
+        elif "ids" in kwargs:
+            given_ids = kwargs["ids"]
+
+        # take the metadata schema from the first row, so that rows with the same
+        # keys only have their datetime keys converted; other rows fall back to
+        # checking every value
+        schema_keys: AbstractSet[str] = set()
+        datetime_keys: Set[str] = set()
+        if metadatas is not None and texts:
+            schema_keys = metadatas[offset].keys()
+            datetime_keys = _datetime_keys(metadatas[offset])
+
+        ids = []
+        for i, text in enumerate(texts, start=offset):
+            data_properties = {self._text_key: text}
+            if metadatas is not None:
+                metadata = metadatas[i]
+                data_properties.update(metadata)
+                keys = (
+                    datetime_keys if metadata.keys() == schema_keys else metadata.keys()
+                )
+                for key in keys:
+                    data_properties[key] = _json_serializable(metadata[key])
+
+            # a fresh uuid4 is always valid, so it needs no further validation
+            _id = given_ids[i] if given_ids is not None else str(uuid4())
+
+            batch.add_object(
+                collection=self._index_name,
+                properties=data_properties,
+                uuid=_id,
+                vector=embeddings[i - offset] if embeddings is not None else None,
+                tenant=tenant,
+            )
+
+            ids.append(_id)
+
+        return ids
+
+    def _batch_context(
+        self,
+        batch_size: Optional[int] = None,
+        concurrent_requests: int = 2,
+        **kwargs: Any,
+    ) -> ClientBatchingContextManager:
+        """Return a fixed-size batch if ``batch_size`` is given, else a dynamic one."""
+        if batch_size is None:
+            return self._client.batch.dynamic()
+
+        return self._client.batch.fixed_size(
+            batch_size=batch_size, concurrent_requests=concurrent_requests
+        )
+
+    def _create_tenant_if_missing(self, tenant: Optional[str]) -> None:
+        """Create the tenant in Weaviate if it does not exist yet."""
         if tenant and not self._does_tenant_exist(tenant):
             logger.info(
                 f"Tenant {tenant} does not exist in index {self._index_name}. "
@@ -161,38 +544,8 @@ class WeaviateVectorStore(VectorStore):
             tenant_objs = [weaviate.classes.tenants.Tenant(name=tenant)]
             self._collection.tenants.create(tenants=tenant_objs)
 
-        ids = []
-        embeddings: Optional[List[List[float]]] = None
-        if self._embedding:
-            embeddings = self._embedding.embed_documents(list(texts))
-
-        with self._client.batch.dynamic() as batch:
-            for i, text in enumerate(texts):
-                data_properties = {self._text_key: text}
-                if metadatas is not None:
-                    for key, val in metadatas[i].items():
-                        data_properties[key] = _json_serializable(val)
-
-                # Allow for ids (consistent w/ other methods)
-                # # Or uuids (backwards compatible w/ existing arg)
-                # If the UUID of one of the objects already exists
-                # then the existing object will be replaced by the new object.
-                _id = get_valid_uuid(uuid4())
-                if "uuids" in kwargs:
-                    _id = kwargs["uuids"][i]
-                elif "ids" in kwargs:
-                    _id = kwargs["ids"][i]
-
-                batch.add_object(
-                    collection=self._index_name,
-                    properties=data_properties,
-                    uuid=_id,
-                    vector=embeddings[i] if embeddings else None,
-                    tenant=tenant,
-                )
-
-                ids.append(_id)
-
+    def _log_failed_objects(self) -> None:
+        """Log the objects that failed to be added in the last batch."""
         failed_objs = self._client.batch.failed_objects
         for obj in failed_objs:
             err_message = (
@@ -201,8 +554,6 @@ class WeaviateVectorStore(VectorStore):
 
             logger.error(err_message)
 
-        return ids
-
     @overload
     def _perform_search(
         self,
@@ -249,19 +600,83 @@ class WeaviateVectorStore(VectorStore):
         Raises:
         ValueError: If _embedding is None or an invalid search method is provided.
         """
+        return_uuids = kwargs.pop("return_uuids", False)
+
+        objects = self._query_objects(query, k, tenant=tenant, **kwargs)
+
+        docs = self._objects_to_documents(objects, return_uuids=return_uuids)
+
+        if return_score:
+            return [(doc, obj.metadata.score) for doc, obj in zip(docs, objects)]
+        else:
+            return docs
+
+    @overload
+    async def _aperform_search(
+        self,
+        query: Optional[str],
+        k: int,
+        return_score: Literal[False] = False,
+        tenant: Optional[str] = None,
+        **kwargs: Any,
+    ) -> List[Document]: ...
+    @overload
+    async def _aperform_search(
+        self,
+        query: Optional[str],
+        k: int,
+        return_score: Literal[True],
+        tenant: Optional[str] = None,
+        **kwargs: Any,
+    ) -> List[Tuple[Document, float]]: ...
+    async def _aperform_search(
+        self,
+        query: Optional[str],
+        k: int,
+        return_score: bool = False,
+        tenant: Optional[str] = None,
+        **kwargs: Any,
+    ) -> Union[List[Document], List[Tuple[Document, float]]]:
+        """
+        Async version of ``_perform_search``.
+
+        The query is embedded with the async embeddings API, and the blocking
+        Weaviate query runs in an executor, so that concurrent searches overlap.
+        """
         if self._embedding is None:
             raise ValueError("_embedding cannot be None for similarity_search")
 
-        if "return_metadata" not in kwargs:
-            kwargs["return_metadata"] = ["score"]
-        elif "score" not in kwargs["return_metadata"]:
-            kwargs["return_metadata"].append("score")
+        if kwargs.get("vector") is None and query is not None:
+            kwargs["vector"] = await self._embedding.aembed_query(query)
 
-        if (
-            "return_properties" in kwargs
-            and self._text_key not in kwargs["return_properties"]
-        ):
-            kwargs["return_properties"].append(self._text_key)
+        return await run_in_executor(
+            None,
+            self._perform_search,  # type: ignore[arg-type]
+            query,
+            k,
+            return_score,
+            tenant,
+            **kwargs,
+        )
+
+    def _query_objects(
+        self,
+        query: Optional[str],
+        k: int,
+        tenant: Optional[str] = None,
+        **kwargs: Any,
+    ) -> List[Any]:
+        """Run a hybrid query and return the raw Weaviate result objects."""
+        if self._embedding is None:
+            raise ValueError("_embedding cannot be None for similarity_search")
+
+        return_metadata = kwargs.setdefault("return_metadata", ["score"])
+        if "score" not in return_metadata:
+            return_metadata.append("score")
+
+        return_properties = kwargs.get("return_properties")
+        if return_properties is not None and self._text_key not in return_properties:
+            return_properties.append(self._text_key)
 
         vector = kwargs.pop("vector", None)
 
@@ -274,8 +689,6 @@ class WeaviateVectorStore(VectorStore):
             else:
                 vector = self._embedding.embed_query(query)
 
-        return_uuids = kwargs.pop("return_uuids", False)
-
         with self._tenant_context(tenant) as collection:
             try:
                 result = collection.query.hybrid(
@@ -284,28 +697,33 @@ class WeaviateVectorStore(VectorStore):
             except weaviate.exceptions.WeaviateQueryException as e:
                 raise ValueError(f"Error during query: {e}")
 
-        docs_and_scores: List[Tuple[Document, float]] = []
-        for obj in result.objects:
-            text = obj.properties.pop(self._text_key)
-            filtered_metadata = {
-                k: v
-                for k, v in obj.metadata.__dict__.items()
-                if v is not None and k != "score"
-            }
-            merged_props = {
-                **obj.properties,
-                **filtered_metadata,
-                **({"vector": obj.vector["default"]} if obj.vector else {}),
-                **({"uuid": str(obj.uuid)} if return_uuids else {}),
-            }
-            doc = Document(page_content=text, metadata=merged_props)
-            score = obj.metadata.score
-            docs_and_scores.append((doc, score))
+        return result.objects
 
-        if return_score:
-            return docs_and_scores
-        else:
-            return [doc for doc, _ in docs_and_scores]
+    def _objects_to_documents(
+        self,
+        objects: List[Any],
+        return_uuids: bool = False,
+        return_vector: bool = True,
+    ) -> List[Document]:
+        """Convert Weaviate result objects into Documents.
+
+        The properties dict of each object is reused as the Document metadata, so
+        no intermediate dicts are built per object.
+        """
+        docs = []
+        for obj in objects:
+            metadata = obj.properties
+            text = metadata.pop(self._text_key)
+            for key, value in obj.metadata.__dict__.items():
+                if value is not None and key != "score":
+                    metadata[key] = value
+            if return_vector and obj.vector:
+                metadata["vector"] = obj.vector["default"]
+            if return_uuids:
+                metadata["uuid"] = str(obj.uuid)
+            docs.append(Document(page_content=text, metadata=metadata))
+
+        return docs
 
     def similarity_search(
         self, query: str, k: int = 4, **kwargs: Any
@@ -325,6 +743,28 @@ class WeaviateVectorStore(VectorStore):
         result = self._perform_search(query, k, **kwargs)
         return result
 
+    async def asimilarity_search(
+        self, query: str, k: int = 4, **kwargs: Any
+    ) -> List[Document]:
+        """Return docs most similar to query.
+
+        Unlike the default implementation, the query is embedded asynchronously,
+        so multiple searches can be awaited concurrently, e.g. with
+        ``asyncio.gather``.
+
+        Args:
+            query: Text to look up documents similar to.
+            k: Number of Documents to return. Defaults to 4.
+            **kwargs: Additional keyword arguments will be passed to the `hybrid()`
+                function of the weaviate client.
+
+        Returns:
+            List of Documents most similar to the query.
+        """
+
+        result = await self._aperform_search(query, k, **kwargs)
+        return result
+
     def max_marginal_relevance_search(
         self,
         query: str,
@@ -387,7 +827,10 @@ class WeaviateVectorStore(VectorStore):
             List of Documents selected by maximal marginal relevance.
         """
 
-        results = self._perform_search(
+        return_uuids = kwargs.pop("return_uuids", False)
+
+        # only the k selected candidates are converted into Documents
+        objects = self._query_objects(
             query=None,
             k=fetch_k,
             include_vector=True,
@@ -395,19 +838,21 @@ class WeaviateVectorStore(VectorStore):
             **kwargs,
         )
 
-        embeddings = [result.metadata["vector"] for result in results]
+        embeddings = np.asarray(
+            [obj.vector["default"] for obj in objects], dtype=np.float32
+        )
         mmr_selected = maximal_marginal_relevance(
-            np.array(embedding), embeddings, k=k, lambda_mult=lambda_mult
+            np.asarray(embedding, dtype=np.float32),
+            embeddings,
+            k=k,
+            lambda_mult=lambda_mult,
         )
 
-        docs = []
-
-        for idx in mmr_selected:
-            text = results[idx].page_content
-            results[idx].metadata.pop("vector")
-            docs.append(Document(page_content=text, metadata=results[idx].metadata))
-
-        return docs
+        return self._objects_to_documents(
+            [objects[idx] for idx in mmr_selected],
+            return_uuids=return_uuids,
+            return_vector=False,
+        )
 
     def similarity_search_with_score(
         self, query: str, k: int = 4, **kwargs: Any
@@ -422,6 +867,15 @@ class WeaviateVectorStore(VectorStore):
 
         return results
 
+    async def asimilarity_search_with_score(
+        self, query: str, k: int = 4, **kwargs: Any
+    ) -> List[Tuple[Document, float]]:
+        """Async version of ``similarity_search_with_score``."""
+
+        results = await self._aperform_search(query, k, return_score=True, **kwargs)
+
+        return results
+
     @classmethod
     def from_texts(
         cls,
@@ -436,13 +890,15 @@ class WeaviateVectorStore(VectorStore):
         relevance_score_fn: Optional[
             Callable[[float], float]
         ] = _default_score_normalizer,
+        vector_index_config: Optional[Dict] = None,
         **kwargs: Any,
     ) -> WeaviateVectorStore:
         """Construct Weaviate wrapper from raw documents.
 
         This is a user-friendly interface that:
             1. Embeds documents.
-            2. Creates a new index for the embeddings in the Weaviate instance.
+            2. Creates a new index for the embeddings in the Weaviate instance,
+               while the first ``embed_batch_size`` documents are being embedded.
             3. Adds the documents to the newly created Weaviate index.
 
         This is intended to be a quick way to get started.
@@ -458,7 +914,10 @@ class WeaviateVectorStore(VectorStore):
             relevance_score_fn: Function for converting whatever distance function the
                 vector store uses to a relevance score, which is a normalized similarity
                 score (0 means dissimilar, 1 means similar).
-            **kwargs: Additional named parameters to pass to ``Weaviate.__init__()``.
+            vector_index_config: ``vectorIndexConfig`` of the collection when it
+                is created, e.g. ``{"bq": {"enabled": True}}``.
+            **kwargs: Additional named parameters to pass to ``add_texts()``, such
+                as ``embed_batch_size``.
 
         Example:
             .. code-block:: python
@@ -475,18 +934,43 @@ class WeaviateVectorStore(VectorStore):
         """
 
         attributes = list(metadatas[0].keys()) if metadatas else None
+        embed_batch_size = kwargs.pop("embed_batch_size", 512)
+        _check_embed_batch_size(embed_batch_size)
+        texts_iter = iter(texts)
+        first_chunk = list(islice(texts_iter, embed_batch_size))
 
-        weaviate_vector_store = cls(
-            client,
-            index_name,
-            text_key,
-            embedding=embedding,
-            attributes=attributes,
-            relevance_score_fn=relevance_score_fn,
-            use_multi_tenancy=tenant is not None,
-        )
+        # embed the first chunk while the collection is checked for and created
+        executor = ThreadPoolExecutor(max_workers=1)
+        try:
+            first_future = (
+                executor.submit(_embed_documents, embedding, first_chunk)
+                if embedding and first_chunk
+                else None
+            )
+
+            weaviate_vector_store = cls(
+                client,
+                index_name,
+                text_key,
+                embedding=embedding,
+                attributes=attributes,
+                relevance_score_fn=relevance_score_fn,
+                use_multi_tenancy=tenant is not None,
+                vector_index_config=vector_index_config,
+            )
+
+            first_embeddings = first_future.result() if first_future else None
+        finally:
+            # don't wait on the embedding if creating the store failed
+            executor.shutdown(wait=False, cancel_futures=True)
 
-        weaviate_vector_store.add_texts(texts, metadatas, tenant=tenant, **kwargs)
+        embedded_chunks = chain(
+            [(first_chunk, first_embeddings)] if first_chunk else [],
+            weaviate_vector_store._embed_chunks(texts_iter, embed_batch_size),
+        )
+        weaviate_vector_store._add_embedded_chunks(
+            embedded_chunks, metadatas, tenant, **kwargs
+        )
 
         return weaviate_vector_store
 
@@ -494,6 +978,8 @@ class WeaviateVectorStore(VectorStore):
         self,
         ids: Optional[List[str]] = None,
         tenant: Optional[str] = None,
+        delete_batch_size: int = 10_000,
+        max_concurrency: int = 4,
         **kwargs: Any,
     ) -> None:
         """Delete by vector IDs.
@@ -501,15 +987,36 @@ class WeaviateVectorStore(VectorStore):
         Args:
             ids: List of ids to delete.
             tenant: The tenant name. Defaults to None.
+            delete_batch_size: Maximum number of ids to delete per request.
+                Weaviate deletes at most ``QUERY_MAXIMUM_RESULTS`` objects per
+                request (10,000 by default). Defaults to 10,000.
+            max_concurrency: Maximum number of delete requests in flight.
+                Defaults to 4.
         """
 
         if ids is None:
             raise ValueError("No ids provided to delete.")
 
-        id_filter = weaviate.classes.query.Filter.by_id().contains_any(ids)
+        id_batches = [
+            ids[i : i + delete_batch_size]
+            for i in range(0, len(ids), delete_batch_size)
+        ]
 
         with self._tenant_context(tenant) as collection:
-            collection.data.delete_many(where=id_filter)
+
+            def _delete_batch(batch_ids: List[str]) -> None:
+                id_filter = weaviate.classes.query.Filter.by_id().contains_any(
+                    batch_ids
+                )
+                collection.data.delete_many(where=id_filter)
+
+            if len(id_batches) <= 1:
+                for batch_ids in id_batches:
+                    _delete_batch(batch_ids)
+            else:
+                with ThreadPoolExecutor(max_workers=max_concurrency) as executor:
+                    # consume the iterator so that errors are raised here
+                    list(executor.map(_delete_batch, id_batches))
 
     def _does_tenant_exist(self, tenant: str) -> bool:
         """Check if tenant exists in Weaviate."""
@@ -538,7 +1045,9 @@ class WeaviateVectorStore(VectorStore):
         if tenant is None and self._multi_tenancy_enabled:
             raise ValueError("Must use tenant context when multi-tenancy is enabled")
 
+        collection = self._collection if tenant is None else self._with_tenant(tenant)
+
         try:
-            yield self._collection.with_tenant(tenant)
+            yield collection
         finally:
             pass
@@ -0,0 +1,37 @@
+from typing import List
+
+import numpy as np
+import pytest
+
+from langchain_weaviate.utils import maximal_marginal_relevance
+
+
+@pytest.mark.parametrize(
+    "lambda_mult, expected_result",
+    [
+        # only relevance matters: pick the two vectors closest to the query
+        (1.0, [0, 1]),
+        # diversity matters: skip the near-duplicate of the first pick
+        (0.3, [0, 2]),
+    ],
+)
+def test_maximal_marginal_relevance(
+    lambda_mult: float, expected_result: List[int]
+) -> None:
+    query_embedding = np.array([1.0, 0.0])
+    embedding_list = [[1.0, 0.0], [1.0, 0.1], [0.0, 1.0]]
+
+    result = maximal_marginal_relevance(
+        query_embedding, embedding_list, lambda_mult=lambda_mult, k=2
+    )
+
+    assert result == expected_result
+
+
+def test_maximal_marginal_relevance_k_larger_than_candidates() -> None:
+    query_embedding = np.array([1.0, 0.0])
+    embedding_list = [[1.0, 0.0], [0.0, 1.0]]
+
+    result = maximal_marginal_relevance(query_embedding, embedding_list, k=5)
+
+    assert sorted(result) == [0, 1]
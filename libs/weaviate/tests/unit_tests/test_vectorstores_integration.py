@@ -1,14 +1,17 @@
 """Test Weaviate functionality."""
 
+import asyncio
 import logging
 import re
 import uuid
 from typing import Any, List, Optional, Union, cast
 
+import numpy as np
 import pytest
 import requests
 import weaviate  # type: ignore
 from langchain_core.documents import Document
+from weaviate.collections.classes.config import _VectorIndexConfigHNSW
 
 from langchain_weaviate.vectorstores import WeaviateVectorStore
 
@@ -180,6 +183,30 @@ def test_similarity_search_by_text(
     assert "foo" in output[0].page_content
 
 
+@pytest.mark.asyncio
+async def test_asimilarity_search(
+    weaviate_client: weaviate.WeaviateClient,
+    texts: List[str],
+    consistent_embedding: ConsistentFakeEmbeddings,
+) -> None:
+    docsearch = WeaviateVectorStore.from_texts(
+        texts,
+        consistent_embedding,
+        client=weaviate_client,
+    )
+
+    outputs = await asyncio.gather(
+        *(docsearch.asimilarity_search(text, k=1) for text in texts)
+    )
+    assert outputs == [[Document(page_content=text)] for text in texts]
+
+    results = await docsearch.asimilarity_search_with_score("foo", k=1)
+    assert len(results) == 1
+    doc, score = results[0]
+    assert doc.page_content == "foo"
+    assert isinstance(score, float)
+
+
 def test_max_marginal_relevance_search(
     weaviate_client: weaviate.WeaviateClient,
     consistent_embedding: ConsistentFakeEmbeddings,
@@ -284,6 +311,109 @@ def test_add_texts_with_given_embedding(
     ]
 
 
+@pytest.mark.asyncio
+async def test_aadd_texts(
+    weaviate_client: weaviate.WeaviateClient,
+    consistent_embedding: ConsistentFakeEmbeddings,
+) -> None:
+    index_name = f"TestIndex_{uuid.uuid4().hex}"
+    texts = ["foo", "bar", "baz"]
+
+    docsearch = WeaviateVectorStore(
+        client=weaviate_client,
+        index_name=index_name,
+        text_key="text",
+        embedding=consistent_embedding,
+    )
+
+    ids = await docsearch.aadd_texts(
+        texts, metadatas=[{"page": i} for i in range(len(texts))], embed_batch_size=2
+    )
+
+    assert len(ids) == len(texts)
+    output = docsearch.similarity_search("foo", k=1)
+    assert output == [Document(page_content="foo", metadata={"page": 0})]
+
+
+def test_add_texts_with_fixed_size_batches(
+    weaviate_client: weaviate.WeaviateClient,
+    embedding: FakeEmbeddings,
+) -> None:
+    index_name = f"TestIndex_{uuid.uuid4().hex}"
+    texts = [f"text {i}" for i in range(5)]
+
+    WeaviateVectorStore.from_texts(
+        texts,
+        embedding=embedding,
+        client=weaviate_client,
+        index_name=index_name,
+        batch_size=2,
+        concurrent_requests=1,
+    )
+
+    total_docs = (
+        weaviate_client.collections.get(index_name)
+        .aggregate.over_all(total_count=True)
+        .total_count
+    )
+    assert total_docs == len(texts)
+
+
+def test_add_texts_from_iterator(
+    weaviate_client: weaviate.WeaviateClient,
+    consistent_embedding: ConsistentFakeEmbeddings,
+) -> None:
+    index_name = f"TestIndex_{uuid.uuid4().hex}"
+    texts = ["foo", "bar", "baz"]
+
+    docsearch = WeaviateVectorStore(
+        client=weaviate_client,
+        index_name=index_name,
+        text_key="text",
+        embedding=consistent_embedding,
+    )
+
+    ids = docsearch.add_texts(
+        (text for text in texts),
+        metadatas=[{"page": i} for i in range(len(texts))],
+        embed_batch_size=2,
+    )
+
+    assert len(ids) == len(texts)
+    output = docsearch.similarity_search("baz", k=1)
+    assert output == [Document(page_content="baz", metadata={"page": 2})]
+
+
+def test_add_embeddings(
+    weaviate_client: weaviate.WeaviateClient,
+    texts: List[str],
+    consistent_embedding: ConsistentFakeEmbeddings,
+) -> None:
+    index_name = f"TestIndex_{uuid.uuid4().hex}"
+
+    # no embedding model is needed when the embeddings are given
+    docsearch = WeaviateVectorStore(
+        client=weaviate_client,
+        index_name=index_name,
+        text_key="text",
+    )
+
+    embeddings = consistent_embedding.embed_documents(texts)
+    ids = docsearch.add_embeddings(
+        texts, embeddings, metadatas=[{"page": i} for i in range(len(texts))]
+    )
+    assert len(ids) == len(texts)
+
+    obj = weaviate_client.collections.get(index_name).query.fetch_object_by_id(
+        ids[1], include_vector=True
+    )
+    assert obj.properties == {"text": texts[1], "page": 1}
+    assert np.allclose(obj.vector["default"], embeddings[1])
+
+    with pytest.raises(ValueError, match="There must be exactly one embedding"):
+        docsearch.add_embeddings(texts, embeddings[:1])
+
+
 def test_add_texts_with_given_uuids(
     weaviate_client: weaviate.WeaviateClient,
     texts: List[str],
@@ -394,6 +524,25 @@ def test_similarity_search_with_score(
     assert doc.page_content == "cat"
 
 
+def test_similarity_search_with_relevance_scores(
+    weaviate_client: weaviate.WeaviateClient,
+    consistent_embedding: ConsistentFakeEmbeddings,
+) -> None:
+    texts = ["cat", "dog"]
+
+    docsearch = WeaviateVectorStore.from_texts(
+        texts, consistent_embedding, client=weaviate_client
+    )
+
+    results = docsearch.similarity_search_with_relevance_scores("kitty", k=2)
+
+    assert len(results) == 2
+    assert results[0][0].page_content == "cat"
+    for _, score in results:
+        assert isinstance(score, float)
+        assert 0 <= score <= 1
+
+
 @pytest.mark.parametrize(
     "use_multi_tenancy, tenant", [(True, "TestTenant"), (False, None)]
 )
@@ -437,6 +586,32 @@ def test_delete(
         docsearch.delete()
 
 
+def test_delete_in_batches(
+    weaviate_client: weaviate.WeaviateClient,
+    embedding: FakeEmbeddings,
+) -> None:
+    index_name = f"Index_{uuid.uuid4().hex}"
+    texts = [f"text {i}" for i in range(10)]
+
+    docsearch = WeaviateVectorStore(
+        client=weaviate_client,
+        index_name=index_name,
+        text_key="text",
+        embedding=embedding,
+    )
+    docids = docsearch.add_texts(texts)
+
+    # leave one document behind to check that only the given ids are deleted
+    docsearch.delete(docids[:-1], delete_batch_size=3)
+
+    total_docs_after_delete = (
+        weaviate_client.collections.get(index_name)
+        .aggregate.over_all(total_count=True)
+        .total_count
+    )
+    assert total_docs_after_delete == 1
+
+
 @pytest.mark.parametrize("use_multi_tenancy", [True, False])
 def test_enable_multi_tenancy(
     use_multi_tenancy: bool,
@@ -457,6 +632,26 @@ def test_enable_multi_tenancy(
     assert schema.multi_tenancy_config.enabled == use_multi_tenancy
 
 
+def test_vector_index_config(
+    weaviate_client: weaviate.WeaviateClient,
+    embedding: FakeEmbeddings,
+) -> None:
+    index_name = f"Index_{uuid.uuid4().hex}"
+
+    _ = WeaviateVectorStore(
+        client=weaviate_client,
+        index_name=index_name,
+        text_key="text",
+        embedding=embedding,
+        vector_index_config={"bq": {"enabled": True}},
+    )
+
+    schema = weaviate_client.collections.get(index_name).config.get(simple=False)
+    vector_index_config = schema.vector_index_config
+    assert isinstance(vector_index_config, _VectorIndexConfigHNSW)
+    assert vector_index_config.quantizer is not None
+
+
 def test_tenant_exists(
     weaviate_client: weaviate.WeaviateClient,
     embedding: FakeEmbeddings,
@@ -592,6 +787,11 @@ def test_search_with_multi_tenancy(
     # search with tenant with MT enabled
     docsearch.similarity_search("foo", k=1, tenant=tenant_name)
 
+    # the tenant's collection object is reused across searches
+    with docsearch._tenant_context(tenant_name) as first:
+        with docsearch._tenant_context(tenant_name) as second:
+            assert first is second
+
     # search with tenant with MT disabled
     docsearch._multi_tenancy_enabled = (
         False  # doesn't actually do anything to weaviate's schema
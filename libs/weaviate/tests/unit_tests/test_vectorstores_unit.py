@@ -1,20 +1,91 @@
+import asyncio
 import datetime
-from typing import Union
+import time
+from typing import Any, Dict, List, Union
+from unittest.mock import MagicMock
 
 import numpy as np
 import pytest
+import weaviate  # type: ignore
+from langchain_core.embeddings import Embeddings
+from pytest_mock import MockerFixture
 
 from langchain_weaviate.vectorstores import (
+    WeaviateVectorStore,
+    _aembed_documents,
+    _datetime_keys,
     _default_score_normalizer,
+    _embed_documents,
     _json_serializable,
+    _normalize_scores,
 )
 
+from .fake_embeddings import AngularTwoDimensionalEmbeddings
+
+
+class RecordingBatch:
+    """Stand-in for a Weaviate batch that records the objects added to it."""
+
+    def __init__(self, delay: float = 0.0) -> None:
+        self.objects: List[Dict[str, Any]] = []
+        self.delay = delay
+
+    def add_object(self, **kwargs: Any) -> None:
+        time.sleep(self.delay)
+        self.objects.append(kwargs)
+
+
+class OutOfOrderEmbeddings(AngularTwoDimensionalEmbeddings):
+    """Async embeddings where later shards finish first, recording how many texts
+    were embedded but not yet uploaded to ``batch`` whenever a shard starts."""
+
+    def __init__(self, batch: RecordingBatch) -> None:
+        self.batch = batch
+        self.started = 0
+        self.max_outstanding = 0
+
+    async def aembed_documents(self, texts: List[str]) -> List[List[float]]:
+        self.started += len(texts)
+        self.max_outstanding = max(
+            self.max_outstanding, self.started - len(self.batch.objects)
+        )
+        # the texts are increasing angles, so later shards sleep less
+        await asyncio.sleep(0.01 * (1 - float(texts[0])))
+        return self.embed_documents(texts)
+
+
+@pytest.fixture
+def weaviate_client(mocker: MockerFixture) -> MagicMock:
+    client = mocker.MagicMock(spec=weaviate.WeaviateClient)
+    client.collections = mocker.MagicMock()
+    collection = client.collections.get.return_value
+    collection.config.get.return_value.multi_tenancy_config.enabled = False
+    client.batch = mocker.MagicMock()
+    client.batch.failed_objects = []
+    return client
+
+
+def make_store(
+    client: MagicMock, batch: RecordingBatch, embedding: Embeddings
+) -> WeaviateVectorStore:
+    client.batch.dynamic.return_value.__enter__.return_value = batch
+    return WeaviateVectorStore(client, "TestIndex", "text", embedding=embedding)
+
 
 @pytest.mark.parametrize("val, expected_result", [(1e6, 1.0), (-1e6, 0.0)])
 def test_default_score_normalizer(val: float, expected_result: float) -> None:
     assert np.isclose(_default_score_normalizer(val), expected_result, atol=1e-6)
 
 
+def test_normalize_scores() -> None:
+    scores = np.array([1e6, -1e6, 0.0, 2.5])
+
+    result = _normalize_scores(scores)
+
+    expected_result = [_default_score_normalizer(score) for score in scores]
+    assert np.allclose(result, expected_result, atol=1e-6)
+
+
 @pytest.mark.parametrize(
     "value, expected_result",
     [
@@ -29,3 +100,207 @@ def test_json_serializable(
     expected_result: Union[str, int, None],
 ) -> None:
     assert _json_serializable(value) == expected_result
+
+
+def test_embed_documents_deduplicates_texts(mocker: MockerFixture) -> None:
+    embedding = AngularTwoDimensionalEmbeddings()
+    spy = mocker.spy(embedding, "embed_documents")
+    texts = ["0.5", "1.0", "0.5", "1.0", "0.25"]
+
+    result = _embed_documents(embedding, texts)
+
+    spy.assert_called_once_with(["0.5", "1.0", "0.25"])
+    assert result == [embedding.embed_query(text) for text in texts]
+
+
+def test_embed_documents_sorts_texts_by_length(mocker: MockerFixture) -> None:
+    embedding = AngularTwoDimensionalEmbeddings()
+    spy = mocker.spy(embedding, "embed_documents")
+    texts = ["0.125", "1", "0.25"]
+
+    result = _embed_documents(embedding, texts)
+
+    spy.assert_called_once_with(["1", "0.25", "0.125"])
+    assert result == [embedding.embed_query(text) for text in texts]
+
+
+@pytest.mark.asyncio
+async def test_aembed_documents_deduplicates_texts(mocker: MockerFixture) -> None:
+    embedding = AngularTwoDimensionalEmbeddings()
+    spy = mocker.spy(embedding, "aembed_documents")
+    texts = ["0.5", "1.0", "0.5", "1.0", "0.25"]
+
+    result = await _aembed_documents(embedding, texts)
+
+    spy.assert_called_once_with(["0.5", "1.0", "0.25"])
+    assert result == [embedding.embed_query(text) for text in texts]
+
+
+def test_datetime_keys() -> None:
+    metadata: dict = {"page": 1, "created": datetime.datetime(2022, 1, 1), "x": None}
+
+    assert _datetime_keys(metadata) == {"created", "x"}
+
+
+def test_add_texts_serializes_datetime_metadata(weaviate_client: MagicMock) -> None:
+    batch = RecordingBatch()
+    docsearch = make_store(weaviate_client, batch, AngularTwoDimensionalEmbeddings())
+    created = datetime.datetime(2022, 1, 1)
+    metadatas: List[dict] = [
+        {"page": 1, "created": created, "updated": None},
+        {"page": 2, "created": created, "updated": created},
+        # a different keyset falls back to checking every value
+        {"page": 3, "deleted": created},
+    ]
+
+    docsearch.add_texts(["0.1", "0.2", "0.3"], metadatas)
+
+    assert [obj["properties"] for obj in batch.objects] == [
+        {"text": "0.1", "page": 1, "created": created.isoformat(), "updated": None},
+        {
+            "text": "0.2",
+            "page": 2,
+            "created": created.isoformat(),
+            "updated": created.isoformat(),
+        },
+        {"text": "0.3", "page": 3, "deleted": created.isoformat()},
+    ]
+
+
+@pytest.mark.asyncio
+async def test_aadd_texts_pipeline(weaviate_client: MagicMock) -> None:
+    batch = RecordingBatch(delay=0.005)
+    embedding = OutOfOrderEmbeddings(batch)
+    docsearch = make_store(weaviate_client, batch, embedding)
+    texts = [str(i / 100) for i in range(40)]
+    metadatas = [{"page": i} for i in range(len(texts))]
+    given_ids = [f"id-{i}" for i in range(len(texts))]
+
+    ids = await docsearch.aadd_texts(
+        texts,
+        metadatas=metadatas,
+        embed_batch_size=4,
+        max_concurrency=2,
+        ids=given_ids,
+    )
+
+    assert ids == given_ids
+    objects = {obj["uuid"]: obj for obj in batch.objects}
+    for i, text in enumerate(texts):
+        obj = objects[given_ids[i]]
+        assert obj["properties"] == {"text": text, "page": i}
+        assert obj["vector"] == embedding.embed_query(text)
+
+    # shards that are embedded or waiting to be uploaded are bounded
+    assert embedding.max_outstanding <= 2 * 4
+
+
+@pytest.mark.asyncio
+async def test_aadd_texts_stops_embedding_when_upload_fails(
+    weaviate_client: MagicMock, mocker: MockerFixture
+) -> None:
+    batch = RecordingBatch()
+    mocker.patch.object(batch, "add_object", side_effect=RuntimeError("upload"))
+    embedding = OutOfOrderEmbeddings(batch)
+    docsearch = make_store(weaviate_client, batch, embedding)
+    texts = [str(i / 100) for i in range(40)]
+
+    with pytest.raises(RuntimeError, match="upload"):
+        await docsearch.aadd_texts(texts, embed_batch_size=4, max_concurrency=2)
+
+    assert asyncio.all_tasks() == {asyncio.current_task()}
+    assert embedding.started < len(texts)
+
+
+def test_from_texts_honours_embed_batch_size(
+    weaviate_client: MagicMock, mocker: MockerFixture
+) -> None:
+    batch = RecordingBatch()
+    weaviate_client.batch.dynamic.return_value.__enter__.return_value = batch
+    embedding = AngularTwoDimensionalEmbeddings()
+    spy = mocker.spy(embedding, "embed_documents")
+    texts = [str(i / 10) for i in range(5)]
+    metadatas = [{"page": i} for i in range(len(texts))]
+    given_ids = [f"id-{i}" for i in range(len(texts))]
+
+    WeaviateVectorStore.from_texts(
+        texts,
+        embedding,
+        metadatas,
+        client=weaviate_client,
+        index_name="TestIndex",
+        embed_batch_size=2,
+        ids=given_ids,
+    )
+
+    assert [len(call.args[0]) for call in spy.call_args_list] == [2, 2, 1]
+    assert [obj["uuid"] for obj in batch.objects] == given_ids
+    for i, (text, obj) in enumerate(zip(texts, batch.objects)):
+        assert obj["properties"] == {"text": text, "page": i}
+        assert obj["vector"] == embedding.embed_query(text)
+
+
+def test_from_texts_does_not_wait_for_embedding_on_error(
+    weaviate_client: MagicMock, mocker: MockerFixture
+) -> None:
+    weaviate_client.collections.exists.side_effect = RuntimeError("schema")
+    embedding = AngularTwoDimensionalEmbeddings()
+
+    def slow_embed_documents(texts: List[str]) -> List[List[float]]:
+        time.sleep(1)
+        return [embedding.embed_query(text) for text in texts]
+
+    mocker.patch.object(embedding, "embed_documents", slow_embed_documents)
+
+    start = time.monotonic()
+    with pytest.raises(RuntimeError, match="schema"):
+        WeaviateVectorStore.from_texts(
+            ["0.1", "0.2"], embedding, client=weaviate_client, index_name="TestIndex"
+        )
+
+    assert time.monotonic() - start < 0.5
+
+
+def test_add_embeddings_accepts_ndarray(weaviate_client: MagicMock) -> None:
+    batch = RecordingBatch()
+    docsearch = make_store(weaviate_client, batch, AngularTwoDimensionalEmbeddings())
+    embeddings = np.array([[0.5, 0.25], [1.0, 0.0]], dtype=np.float16)
+
+    ids = docsearch.add_embeddings(["a", "b"], embeddings)
+
+    assert [obj["uuid"] for obj in batch.objects] == ids
+    assert [obj["vector"] for obj in batch.objects] == [[0.5, 0.25], [1.0, 0.0]]
+
+
+def test_from_texts_passes_vector_index_config(weaviate_client: MagicMock) -> None:
+    weaviate_client.collections.exists.return_value = False
+    weaviate_client.batch.dynamic.return_value.__enter__.return_value = RecordingBatch()
+
+    WeaviateVectorStore.from_texts(
+        ["0.1"],
+        AngularTwoDimensionalEmbeddings(),
+        client=weaviate_client,
+        index_name="TestIndex",
+        vector_index_config={"bq": {"enabled": True}},
+    )
+
+    schema = weaviate_client.collections.create_from_dict.call_args.args[0]
+    assert schema["vectorIndexConfig"] == {"bq": {"enabled": True}}
+
+
+@pytest.mark.asyncio
+async def test_embed_batch_size_must_be_positive(weaviate_client: MagicMock) -> None:
+    batch = RecordingBatch()
+    embedding = AngularTwoDimensionalEmbeddings()
+    docsearch = make_store(weaviate_client, batch, embedding)
+
+    with pytest.raises(ValueError, match="embed_batch_size"):
+        docsearch.add_texts(["0.1"], embed_batch_size=0)
+    with pytest.raises(ValueError, match="embed_batch_size"):
+        await docsearch.aadd_texts(["0.1"], embed_batch_size=0)
+    with pytest.raises(ValueError, match="embed_batch_size"):
+        WeaviateVectorStore.from_texts(
+            ["0.1"], embedding, client=weaviate_client, embed_batch_size=0
+        )
+
+    assert batch.objects == []